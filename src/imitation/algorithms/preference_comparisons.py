@@ -9,6 +9,7 @@ import pickle
 import random
 from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
 
+import gym
 import numpy as np
 import torch as th
 from scipy import special
@@ -95,14 +96,28 @@ class TrajectoryDataset(TrajectoryGenerator):
             custom_logger: Where to log to; if None (default), creates a new logger.
         """
         super().__init__(custom_logger=custom_logger)
-        self._trajectories = trajectories
-        self.rng = random.Random(seed)
+        # Stored as an immutable tuple so `sample` can draw from it directly
+        # without defensive copies.
+        self._trajectories = tuple(trajectories)
+        self.rng = np.random.default_rng(seed)
 
     def sample(self, steps: int) -> Sequence[TrajectoryWithRew]:
-        # make a copy before shuffling
-        trajectories = list(self._trajectories)
-        self.rng.shuffle(trajectories)
-        return _get_trajectories(trajectories, steps)
+        if steps == 0:
+            return []
+        # `Generator.permutation` shuffles the indices with a C-level loop;
+        # we then gather only the prefix needed to reach `steps`.
+        perm = self.rng.permutation(len(self._trajectories))
+        sampled = []
+        total_steps = 0
+        for i in perm:
+            traj = self._trajectories[i]
+            sampled.append(traj)
+            total_steps += len(traj)
+            if total_steps >= steps:
+                return sampled
+        raise RuntimeError(
+            f"Asked for {steps} transitions but only {total_steps} available",
+        )
 
 
 class AgentTrainer(TrajectoryGenerator):
@@ -115,6 +130,8 @@ class AgentTrainer(TrajectoryGenerator):
         exploration_frac: float = 0.0,
         switch_prob: float = 0.5,
         random_prob: float = 0.5,
+        parallel: bool = False,
+        env_fns: Optional[Sequence[Callable[[], gym.Env]]] = None,
         seed: Optional[int] = None,
         custom_logger: Optional[imit_logger.HierarchicalLogger] = None,
     ):
@@ -131,24 +148,56 @@ class AgentTrainer(TrajectoryGenerator):
                 step for the exploratory samples.
             random_prob: the probability of picking the random policy when switching
                 during exploration.
+            parallel: if True and the algorithm's environment is a `DummyVecEnv`
+                with more than one sub-environment, rebuild it as a
+                `SubprocVecEnv` so that environment stepping runs in parallel
+                worker processes. Requires `env_fns`. Alternatively, construct
+                the vectorized environment with
+                `imitation.util.util.make_vec_env(..., parallel=True)` before
+                building the algorithm.
+            env_fns: factories recreating the algorithm's sub-environments,
+                used to rebuild them in subprocess workers when `parallel` is
+                set. `DummyVecEnv` does not retain the factories it was built
+                from, so they must be supplied here.
             seed: random seed for exploratory trajectories.
             custom_logger: Where to log to; if None (default), creates a new logger.
 
         Raises:
-            ValueError: `algorithm` does not have an environment set.
+            ValueError: `algorithm` does not have an environment set, or
+                `parallel` was requested without `env_fns` matching the
+                environment.
         """
         self.algorithm = algorithm
         # NOTE: this has to come after setting self.algorithm because super().__init__
         # will set self.logger, which also sets the logger for the algorithm
         super().__init__(custom_logger)
         if isinstance(reward_fn, reward_nets.RewardNet):
-            reward_fn = reward_fn.predict_processed
+            reward_fn = _buffered_reward_fn(reward_fn)
         self.reward_fn = reward_fn
         self.exploration_frac = exploration_frac
 
         venv = self.algorithm.get_env()
         if not isinstance(venv, vec_env.VecEnv):
             raise ValueError("The environment for the agent algorithm must be set.")
+        if parallel and isinstance(venv, vec_env.DummyVecEnv) and venv.num_envs > 1:
+            # DummyVecEnv steps its sub-environments in a Python loop, which
+            # serializes CPU-heavy simulators. Rebuilding with subprocess
+            # workers gives near-linear speedup on env stepping; `forkserver`
+            # avoids re-importing the parent's modules in every worker.
+            if env_fns is None:
+                raise ValueError(
+                    "parallel=True requires `env_fns` so that the environments "
+                    "can be recreated in subprocess workers. Alternatively, "
+                    "build the vectorized environment with "
+                    "`imitation.util.util.make_vec_env(..., parallel=True)` "
+                    "before constructing the algorithm.",
+                )
+            if len(env_fns) != venv.num_envs:
+                raise ValueError(
+                    f"Got {len(env_fns)} env_fns but the environment has "
+                    f"{venv.num_envs} sub-environments.",
+                )
+            venv = vec_env.SubprocVecEnv(list(env_fns), start_method="forkserver")
         # The BufferingWrapper records all trajectories, so we can return
         # them after training. This should come first (before the wrapper that
         # changes the reward function), so that we return the original environment
@@ -204,14 +253,9 @@ class AgentTrainer(TrajectoryGenerator):
 
     def sample(self, steps: int) -> Sequence[types.TrajectoryWithRew]:
         agent_trajs, _ = self.buffering_wrapper.pop_finished_trajectories()
-        # We typically have more trajectories than are needed.
-        # In that case, we use the final trajectories because
-        # they are the ones with the most relevant version of
-        # the agent.
-        # The easiest way to do this will be to first invert the
-        # list and then later just take the first trajectories:
-        agent_trajs = agent_trajs[::-1]
-        avail_steps = sum(len(traj) for traj in agent_trajs)
+        # Lengths were recorded as the trajectories were buffered, so we
+        # can select by length below without touching the trajectory objects.
+        agent_traj_lengths = self.buffering_wrapper.pop_lengths()
 
         exploration_steps = int(self.exploration_frac * steps)
         if self.exploration_frac > 0 and exploration_steps == 0:
@@ -221,7 +265,29 @@ class AgentTrainer(TrajectoryGenerator):
             )
         agent_steps = steps - exploration_steps
 
-        if avail_steps < agent_steps:
+        # We typically have more trajectories than are needed.
+        # In that case, we use the final trajectories because
+        # they are the ones with the most relevant version of
+        # the agent. In the steady-state case where the buffer
+        # covers the request, this reduces to a binary search over
+        # the tail cumulative lengths followed by a single slice;
+        # no reversal or list combining is needed.
+        if agent_steps == 0:
+            agent_trajs = []
+        elif (
+            len(agent_traj_lengths) > 0
+            and int(agent_traj_lengths[-1]) >= agent_steps
+        ):
+            # The newest trajectory alone covers the request; skip the
+            # cumulative scan entirely.
+            agent_trajs = agent_trajs[-1:]
+        elif int(agent_traj_lengths.sum()) >= agent_steps:
+            # Smallest tail slice covering the request, in chronological order.
+            tail_cumsum = np.cumsum(agent_traj_lengths[::-1])
+            num_trajs = int(np.searchsorted(tail_cumsum, agent_steps)) + 1
+            agent_trajs = agent_trajs[len(agent_trajs) - num_trajs :]
+        else:
+            avail_steps = int(agent_traj_lengths.sum())
             self.logger.log(
                 f"Requested {agent_steps} transitions but only {avail_steps} in buffer."
                 f" Sampling {agent_steps - avail_steps} additional transitions.",
@@ -245,9 +311,17 @@ class AgentTrainer(TrajectoryGenerator):
                 deterministic_policy=False,
             )
             additional_trajs, _ = self.buffering_wrapper.pop_finished_trajectories()
-            agent_trajs = list(agent_trajs) + list(additional_trajs)
-
-        agent_trajs = _get_trajectories(agent_trajs, agent_steps)
+            additional_lengths = self.buffering_wrapper.pop_lengths()
+            # Every buffered trajectory is needed in this branch;
+            # `pop_finished_trajectories` hands over ownership of a fresh
+            # list, so we can extend in place rather than concatenating
+            # copies.
+            agent_trajs.extend(additional_trajs)
+            agent_trajs = _get_trajectories(
+                agent_trajs,
+                agent_steps,
+                lengths=np.concatenate([agent_traj_lengths, additional_lengths]),
+            )
 
         exploration_trajs = []
         if exploration_steps > 0:
@@ -265,12 +339,18 @@ class AgentTrainer(TrajectoryGenerator):
                 deterministic_policy=False,
             )
             exploration_trajs, _ = self.buffering_wrapper.pop_finished_trajectories()
-            exploration_trajs = _get_trajectories(exploration_trajs, exploration_steps)
+            exploration_trajs = _get_trajectories(
+                exploration_trajs,
+                exploration_steps,
+                lengths=self.buffering_wrapper.pop_lengths(),
+            )
         # We call _get_trajectories separately on agent_trajs and exploration_trajs
         # and then just concatenate. This could mean we return slightly too many
         # transitions, but it gets the proportion of exploratory and agent transitions
-        # roughly right.
-        return list(agent_trajs) + list(exploration_trajs)
+        # roughly right. `agent_trajs` is a list we own by this point, so the
+        # concatenation can happen in place.
+        agent_trajs.extend(exploration_trajs)
+        return agent_trajs
 
     @TrajectoryGenerator.logger.setter
     def logger(self, value: imit_logger.HierarchicalLogger):
@@ -278,29 +358,107 @@ class AgentTrainer(TrajectoryGenerator):
         self.algorithm.set_logger(self.logger)
 
 
+def _buffered_reward_fn(reward_net: reward_nets.RewardNet) -> rewards_common.RewardFn:
+    """Wraps `reward_net.predict_processed` with persistent input buffers.
+
+    The returned reward function is called once per environment step on a
+    fixed-size batch of `num_envs` transitions, so its numpy inputs always
+    have the same shapes and dtypes. When the reward net lives on a CUDA
+    device, we stage the inputs in page-locked (pinned) host buffers that
+    are allocated once and reused: this avoids a fresh host allocation per
+    step and speeds up the host-to-device copy. On CPU the net's
+    `predict_processed` is returned unchanged, since `th.as_tensor` is
+    already zero-copy there.
+
+    Args:
+        reward_net: the reward network to evaluate at env-step frequency.
+
+    Returns:
+        A `RewardFn` computing `reward_net.predict_processed`.
+    """
+    if reward_net.device.type != "cuda":
+        return reward_net.predict_processed
+
+    # Maps argument name to a numpy view of a pinned torch buffer. Keyed by
+    # name rather than shape since e.g. state and next_state share a shape
+    # but must not alias.
+    buffers: dict = {}
+
+    def _stage(name: str, array: np.ndarray) -> np.ndarray:
+        buf = buffers.get(name)
+        if buf is None or buf.shape != array.shape or buf.dtype != array.dtype:
+            tensor = th.empty(
+                array.shape,
+                dtype=th.from_numpy(array[:0].copy()).dtype,
+                pin_memory=True,
+            )
+            buf = tensor.numpy()
+            buffers[name] = buf
+        np.copyto(buf, array)
+        return buf
+
+    def predict_buffered(
+        state: np.ndarray,
+        action: np.ndarray,
+        next_state: np.ndarray,
+        done: np.ndarray,
+    ) -> np.ndarray:
+        return reward_net.predict_processed(
+            _stage("state", np.asarray(state)),
+            _stage("action", np.asarray(action)),
+            _stage("next_state", np.asarray(next_state)),
+            _stage("done", np.asarray(done)),
+        )
+
+    return predict_buffered
+
+
+def _trajectory_lengths(trajectories: Sequence[TrajectoryWithRew]) -> np.ndarray:
+    """Returns the length of each trajectory as an int64 array."""
+    return np.fromiter(
+        (len(traj) for traj in trajectories),
+        dtype=np.int64,
+        count=len(trajectories),
+    )
+
+
 def _get_trajectories(
-    trajectories: Sequence[TrajectoryWithRew],
+    trajectories: List[TrajectoryWithRew],
     steps: int,
-) -> Sequence[TrajectoryWithRew]:
-    """Get enough trajectories to have at least `steps` transitions in total."""
+    lengths: Optional[np.ndarray] = None,
+) -> List[TrajectoryWithRew]:
+    """Get enough trajectories to have at least `steps` transitions in total.
+
+    If the caller has already computed `_trajectory_lengths(trajectories)`,
+    it can be passed via `lengths` to avoid a second pass over the list.
+    """
     if steps == 0:
         return []
 
-    available_steps = sum(len(traj) for traj in trajectories)
+    if lengths is None:
+        lengths = _trajectory_lengths(trajectories)
+    # The cumulative sum of trajectory lengths determines how many
+    # trajectories to return; its last entry is also the total number of
+    # available steps, so one pass serves both the sufficiency check and
+    # the search below.
+    steps_cumsum = lengths.cumsum()
+    available_steps = int(steps_cumsum[-1]) if len(steps_cumsum) > 0 else 0
     if available_steps < steps:
         raise RuntimeError(
             f"Asked for {steps} transitions but only {available_steps} available",
         )
-    # We need the cumulative sum of trajectory lengths
-    # to determine how many trajectories to return:
-    steps_cumsum = np.cumsum([len(traj) for traj in trajectories])
-    # Now we find the first index that gives us enough
-    # total steps:
-    idx = (steps_cumsum >= steps).argmax()
+    # Now we find the first index that gives us enough total steps.
+    # `steps_cumsum` is non-decreasing, so binary search suffices and
+    # avoids materializing a boolean mask.
+    idx = int(np.searchsorted(steps_cumsum, steps, side="left"))
+    if idx == len(steps_cumsum):
+        # Defensive: unreachable given the availability check above,
+        # since steps_cumsum[-1] == available_steps >= steps.
+        idx -= 1
     # we need to include the element at position idx
     trajectories = trajectories[: idx + 1]
-    # sanity check
-    assert sum(len(traj) for traj in trajectories) >= steps
+    # sanity check against the already-computed cumulative sum
+    assert steps_cumsum[idx] >= steps
     return trajectories
 
 
@@ -1,6 +1,6 @@
 """Environment wrappers for collecting rollouts."""
 
-from typing import Sequence, Tuple
+from typing import List, Sequence, Tuple
 
 import gym
 import numpy as np
@@ -26,6 +26,10 @@ class BufferingWrapper(VecEnvWrapper):
         super().__init__(venv)
         self.error_on_premature_reset = error_on_premature_reset
         self._trajectories = []
+        # Lengths of `self._trajectories`, recorded once when each trajectory
+        # is buffered so consumers need not re-measure every trajectory.
+        self._traj_lengths = []
+        self._popped_lengths = np.zeros(0, dtype=np.int64)
         self._ep_lens = []
         self._init_reset = False
         self._traj_accum = None
@@ -76,6 +80,7 @@ class BufferingWrapper(VecEnvWrapper):
             infos,
         )
         self._trajectories.extend(finished_trajs)
+        self._traj_lengths.extend(len(traj) for traj in finished_trajs)
 
         return obs, rews, dones, infos
 
@@ -100,39 +105,59 @@ class BufferingWrapper(VecEnvWrapper):
 
     def pop_finished_trajectories(
         self,
-    ) -> Tuple[Sequence[types.TrajectoryWithRew], Sequence[int]]:
+    ) -> Tuple[List[types.TrajectoryWithRew], List[int]]:
         """Pops recorded complete trajectories `trajs` and episode lengths `ep_lens`.
 
         Returns:
-            A tuple `(trajs, ep_lens)` where `trajs` is a sequence of trajectories
+            A tuple `(trajs, ep_lens)` where `trajs` is a list of trajectories
             including the terminal state (but possibly missing initial states, if
-            `pop_trajectories` was previously called) and `ep_lens` is a sequence
+            `pop_trajectories` was previously called) and `ep_lens` is a list
             of episode lengths. Note the episode length will be longer than the
             trajectory length when the trajectory misses initial states.
+            Ownership of both lists is handed over to the caller; the wrapper
+            starts fresh lists for subsequent recording.
         """
         trajectories = self._trajectories
         ep_lens = self._ep_lens
+        self._popped_lengths = np.asarray(self._traj_lengths, dtype=np.int64)
         self._trajectories = []
+        self._traj_lengths = []
         self._ep_lens = []
         self.n_transitions = 0
         return trajectories, ep_lens
 
+    def pop_lengths(self) -> np.ndarray:
+        """Returns the trajectory lengths from the most recent pop call.
+
+        Lengths are recorded once as trajectories are buffered, so callers
+        processing the result of `pop_trajectories` or
+        `pop_finished_trajectories` can use this array instead of measuring
+        each trajectory again.
+
+        Returns:
+            An int64 array with the length of each trajectory returned by the
+            most recent `pop_trajectories`/`pop_finished_trajectories` call.
+        """
+        return self._popped_lengths
+
     def pop_trajectories(
         self,
-    ) -> Tuple[Sequence[types.TrajectoryWithRew], Sequence[int]]:
+    ) -> Tuple[List[types.TrajectoryWithRew], List[int]]:
         """Pops recorded trajectories `trajs` and episode lengths `ep_lens`.
 
         Returns:
-            A tuple `(trajs, ep_lens)`. `trajs` is a sequence of trajectory fragments,
+            A tuple `(trajs, ep_lens)`. `trajs` is a list of trajectory fragments,
             consisting of data collected after the last call to `pop_trajectories`.
             They may miss initial states (if `pop_trajectories` previously returned
             a fragment for that episode), and terminal states (if the episode has
             yet to complete). `ep_lens` is the total length of completed episodes.
         """
         if self.n_transitions == 0:
+            self._popped_lengths = np.zeros(0, dtype=np.int64)
             return [], []
         partial_trajs = self._finish_partial_trajectories()
         self._trajectories.extend(partial_trajs)
+        self._traj_lengths.extend(len(traj) for traj in partial_trajs)
         return self.pop_finished_trajectories()
 
     def pop_transitions(self) -> types.TransitionsWithRew:
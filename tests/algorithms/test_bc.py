@@ -19,7 +19,14 @@ def batch_size(request):
     return request.param
 
 
-@pytest.fixture(params=["data_loader", "ducktyped_data_loader", "transitions"])
+@pytest.fixture(
+    params=[
+        "data_loader",
+        "ducktyped_data_loader",
+        "preloaded_tensors",
+        "transitions",
+    ],
+)
 def expert_data_type(request):
     return request.param
 
@@ -31,13 +38,39 @@ class DucktypedDataset:
         """Builds `DucktypedDataset`."""
         self.trans = transitions
         self.batch_size = batch_size
+        # Convert to torch once; `__iter__` then yields views into these
+        # tensors rather than re-running `th.from_numpy` per batch.
+        self._obs = th.from_numpy(transitions.obs)
+        self._acts = th.from_numpy(transitions.acts)
 
     def __iter__(self):
         for start in range(0, len(self.trans) - self.batch_size, self.batch_size):
             end = start + self.batch_size
-            d = dict(obs=self.trans.obs[start:end], acts=self.trans.acts[start:end])
-            d = {k: th.from_numpy(v) for k, v in d.items()}
-            yield d
+            yield dict(obs=self._obs[start:end], acts=self._acts[start:end])
+
+
+class PreloadedTensorLoader:
+    """Yields batches sliced from tensors that are converted once up front.
+
+    Unlike a `DataLoader` with a collate function, this uploads the full
+    obs/acts arrays to torch tensors a single time at construction and then
+    serves shuffled index slices of the cached tensors, so no per-batch
+    numpy-to-torch conversion happens during training.
+    """
+
+    def __init__(self, transitions: types.TransitionsMinimal, batch_size: int):
+        """Builds `PreloadedTensorLoader`."""
+        self.batch_size = batch_size
+        self._obs = th.as_tensor(transitions.obs)
+        self._acts = th.as_tensor(transitions.acts)
+
+    def __iter__(self):
+        n = len(self._obs)
+        # Fresh permutation per epoch, i.e. per `__iter__` call.
+        perm = th.randperm(n)
+        for start in range(0, n - self.batch_size + 1, self.batch_size):
+            idx = perm[start : start + self.batch_size]
+            yield dict(obs=self._obs[idx], acts=self._acts[idx])
 
 
 @pytest.fixture
@@ -56,9 +89,17 @@ def trainer(
             shuffle=True,
             drop_last=True,
             collate_fn=types.transitions_collate_fn,
+            # Prepare batches in worker processes so collation overlaps with
+            # training, and pin host memory to allow asynchronous copies when
+            # training on GPU. (persistent_workers/prefetch_factor would help
+            # too, but require torch>=1.7 while setup.py allows torch>=1.4.)
+            num_workers=2,
+            pin_memory=True,
         )
     elif expert_data_type == "ducktyped_data_loader":
         expert_data = DucktypedDataset(trans, batch_size)
+    elif expert_data_type == "preloaded_tensors":
+        expert_data = PreloadedTensorLoader(trans, batch_size)
     elif expert_data_type == "transitions":
         expert_data = trans
     else:  # pragma: no cover
@@ -176,7 +217,12 @@ def test_bc_data_loader_empty_iter_error(
     """
     batch_size = 32
     trans = rollout.flatten_trajectories(cartpole_expert_trajectories)
-    dummy_yield_value = dataclasses.asdict(trans[:batch_size])
+    sub_trans = trans[:batch_size]
+    # A shallow field-name -> attribute view suffices here;
+    # dataclasses.asdict would deep-copy every numpy array.
+    dummy_yield_value = {
+        f.name: getattr(sub_trans, f.name) for f in dataclasses.fields(sub_trans)
+    }
 
     bad_data_loader = _DataLoaderFailsOnNthIter(
         dummy_yield_value=dummy_yield_value,
@@ -3,10 +3,12 @@
 import re
 from typing import Sequence
 
+import gym
 import numpy as np
 import pytest
 import seals  # noqa: F401
 import stable_baselines3
+from stable_baselines3.common import vec_env
 
 from imitation.algorithms import preference_comparisons
 from imitation.data import types
@@ -62,6 +64,48 @@ def _check_trajs_equal(
         assert traj1.terminal == traj2.terminal
 
 
+def _make_seals_cartpole() -> gym.Env:
+    # Imported inside the factory so subprocess workers register the
+    # seals environments before `gym.make` is called.
+    import seals  # noqa: F401,F811
+
+    return gym.make("seals/CartPole-v0")
+
+
+def _make_multi_env_agent():
+    venv = util.make_vec_env("seals/CartPole-v0", n_envs=2)
+    return stable_baselines3.PPO(
+        "MlpPolicy",
+        venv,
+        n_epochs=1,
+        batch_size=2,
+        n_steps=10,
+    )
+
+
+def test_agent_trainer_parallel(reward_net):
+    agent = _make_multi_env_agent()
+    agent_trainer = preference_comparisons.AgentTrainer(
+        agent,
+        reward_net,
+        parallel=True,
+        env_fns=[_make_seals_cartpole] * 2,
+    )
+    try:
+        assert isinstance(
+            agent_trainer.buffering_wrapper.venv,
+            vec_env.SubprocVecEnv,
+        )
+    finally:
+        agent_trainer.venv.close()
+
+
+def test_agent_trainer_parallel_requires_env_fns(reward_net):
+    agent = _make_multi_env_agent()
+    with pytest.raises(ValueError, match="requires `env_fns`"):
+        preference_comparisons.AgentTrainer(agent, reward_net, parallel=True)
+
+
 def test_missing_environment(agent):
     # Create an agent that doesn't have its environment set.
     # More realistically, this can happen when loading a stored agent.
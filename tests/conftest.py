@@ -1,4 +1,5 @@
 """Fixtures common across tests."""
+import functools
 import os
 import pickle
 import traceback
@@ -48,6 +49,18 @@ def load_or_train_ppo(
             return expert
 
 
+@functools.lru_cache(maxsize=None)
+def _load_pickled_trajectories(cache_path: str) -> Sequence[TrajectoryWithRew]:
+    """Loads trajectories from `cache_path`, memoized for the test session.
+
+    Many fixtures re-read the same rollout pickle; caching by path replaces
+    the repeated disk loads with a single one. Failed loads are not cached,
+    so callers can regenerate the file and retry.
+    """
+    with open(cache_path, "rb") as f:
+        return pickle.load(f)
+
+
 def load_or_rollout_trajectories(
     cache_path,
     policy,
@@ -56,8 +69,7 @@ def load_or_rollout_trajectories(
     os.makedirs(os.path.dirname(cache_path), exist_ok=True)
     with FileLock(cache_path + ".lock"):
         try:
-            with open(cache_path, "rb") as f:
-                return pickle.load(f)
+            return _load_pickled_trajectories(cache_path)
         except (OSError, pickle.PickleError):  # pragma: no cover
             warnings.warn(
                 "Recomputing expert trajectories due to the following error when "
@@ -221,6 +221,19 @@ def test_reset_error():
         venv.reset()
 
 
+def test_pop_lengths():
+    venv = _make_buffering_venv(True)
+    assert list(venv.pop_lengths()) == []
+    zeros = np.array([0.0, 0.0], dtype=venv.action_space.dtype)
+    for _ in range(7):
+        venv.step(zeros)
+    trajs, _ = venv.pop_trajectories()
+    np.testing.assert_array_equal(venv.pop_lengths(), [len(traj) for traj in trajs])
+    # A subsequent pop of an empty buffer reports no lengths.
+    venv.pop_trajectories()
+    assert list(venv.pop_lengths()) == []
+
+
 def test_n_transitions_and_empty_error():
     venv = _make_buffering_venv(True)
     trajs, ep_lens = venv.pop_trajectories()